@@ -15,7 +15,7 @@ def main():
     
     if not md_files:
         print("No markdown files found in the specified directory.")
-        print("Usage: python script.py <directory_path>")
+        print("Usage: python script.py <directory_path> [output_html_file]")
         return
     
     print(f"Found {len(md_files)} markdown file(s):")
@@ -29,7 +29,10 @@ def main():
     # Read all markdown files
     file_contents = rm.read_all_markdown_files(directory)
     
-    rm.print_content(file_contents, md_files)
+    # Build the entries once; the text and HTML reports are both rendered
+    # from them
+    file_entries = rm.build_entries(file_contents)
+    sys.stdout.write(rm.render_text_report(file_entries, file_contents, md_files))
     
     # Return the file contents for potential use in other scripts
     # return file_contents
@@ -38,20 +41,10 @@ def main():
 
     print("Converting to HTML...")
 
-    if len(sys.argv) < 2:
-        print("Usage: python script.py <file_path> [output_html_file]")
-        print("Example: python script.py report.txt report.html")
-        return
-    
-    input_file = sys.argv[2]
-    output_file = sys.argv[3] if len(sys.argv) > 2 else None
-    
-    if not os.path.exists(input_file):
-        print(f"Error: Input file '{input_file}' does not exist.")
-        return
+    output_file = sys.argv[2] if len(sys.argv) > 2 else None
     
     try:
-        result_file = mth.convert_text_file_to_html(input_file, output_file)
+        result_file = mth.convert_dict_to_html(file_contents, output_file, file_entries)
         print(f"\n🎉 Conversion complete! Open {result_file} in your browser to view the report.")
     except Exception as e:
         print(f"Error: {e}")
@@ -6,138 +6,32 @@ Convert text file with markdown file information to professional HTML format.
 import os
 import sys
 import re
-import html
-import json
+import string
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-def read_text_file(file_path):
-    """
-    Read a text file and return its contents.
-    
-    Args:
-        file_path (str): Path to the text file
-        
-    Returns:
-        str: Contents of the text file
-    """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return content
-    except Exception as e:
-        raise Exception(f"Error reading text file: {e}")
+from read_markdown import build_entries, read_mapped_text
 
-def parse_file_entry(entry_text):
-    """
-    Parse a single file entry from the text format.
-    
-    Args:
-        entry_text (str): Text block for one file
-        
-    Returns:
-        dict: Parsed file information
-    """
-    lines = entry_text.strip().split('\n')
-    
-    # Initialize file info
-    file_info = {
-        'filename': '',
-        'size': '',
-        'lines_count': '',
-        'preview_lines': [],
-        'remaining_lines': 0
-    }
-    
-    # Parse file header
-    in_preview_section = False
-    
-    for line in lines:
-        # Skip separator lines
-        if line.strip().startswith('--'):
-            continue
-            
-        if line.startswith('File: '):
-            file_info['filename'] = line.replace('File: ', '').strip()
-        elif line.startswith('Size: '):
-            # Extract size and line count
-            size_info = line.replace('Size: ', '').strip()
-            if 'characters' in size_info and 'lines' in size_info:
-                parts = size_info.split(',')
-                file_info['size'] = parts[0].strip()
-                file_info['lines_count'] = parts[1].strip()
-        elif line.strip().startswith('Preview (first'):
-            # Start collecting preview lines
-            in_preview_section = True
-            continue
-        elif in_preview_section and re.match(r'^\s*\d+:', line):
-            # This is a preview line
-            file_info['preview_lines'].append(line.strip())
-        elif '... (' in line and 'more lines)' in line:
-            # Extract remaining lines count
-            match = re.search(r'\((\d+) more lines\)', line)
-            if match:
-                file_info['remaining_lines'] = int(match.group(1))
-            in_preview_section = False  # End of preview section
-    
-    return file_info
+# Matches one file entry: its "File: " line plus every following line up to
+# the next "File: " line
+_ENTRY_RE = re.compile(r'^File: [^\n]*(?:\n(?!File: )[^\n]*)*', re.MULTILINE)
 
-def parse_text_content(content):
-    """
-    Parse the entire text content and extract all file entries.
-    
-    Args:
-        content (str): Full text content
-        
-    Returns:
-        list: List of parsed file information dictionaries
-    """
-    # Find the RESULTS section
-    results_start = content.find('RESULTS')
-    if results_start == -1:
-        print("Could not find RESULTS section")
-        return []
-    
-    results_content = content[results_start:]
-    
-    # Split by entries - look for "File: " patterns
-    file_entries = []
-    current_entry = ""
-    
-    lines = results_content.split('\n')
-    for line in lines:
-        if line.startswith('File: '):
-            # Start of new entry, process previous if it exists
-            if current_entry.strip():
-                file_info = parse_file_entry(current_entry)
-                if file_info['filename']:
-                    file_entries.append(file_info)
-            current_entry = line + '\n'
-        elif current_entry:  # We're in an entry
-            current_entry += line + '\n'
-    
-    # Process the last entry
-    if current_entry.strip():
-        file_info = parse_file_entry(current_entry)
-        if file_info['filename']:
-            file_entries.append(file_info)
-    
-    return file_entries
+# Preview lines look like "  1: text"; the end of a preview is "... (N more lines)"
+_PREVIEW_RE = re.compile(r'^\s*\d+:')
+_MORE_RE = re.compile(r'\((\d+) more lines\)')
 
-def generate_html(file_entries, title="Markdown Files Report"):
-    """
-    Generate professional HTML from parsed file entries.
-    
-    Args:
-        file_entries (list): List of file information dictionaries
-        title (str): HTML page title
-        
-    Returns:
-        str: Complete HTML document
-    """
-    
-    # CSS styling with professional blue, grey, white theme
-    css = """
+# Same replacements as html.escape(), applied in a single str.translate pass
+_HTML_TRANS = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+# CSS styling with professional blue, grey, white theme
+_CSS = """
     <style>
         * {
             margin: 0;
@@ -333,101 +227,58 @@ def generate_html(file_entries, title="Markdown Files Report"):
         }
     </style>
     """
-    
-    # Calculate statistics - with error handling
-    total_files = len(file_entries)
-    total_chars = 0
-    total_lines = 0
-    
-    for entry in file_entries:
-        try:
-            if entry['size']:
-                total_chars += int(entry['size'].split()[0])
-        except (ValueError, IndexError):
-            pass
-        try:
-            if entry['lines_count']:
-                total_lines += int(entry['lines_count'].split()[0])
-        except (ValueError, IndexError):
-            pass
-    
-    # Generate HTML
-    html_doc = f"""<!DOCTYPE html>
+
+# Document skeleton; the stylesheet and per-report values are filled in by
+# iter_html()
+_DOC_HEAD_TMPL = string.Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    {css}
+    <title>${title}</title>
+    ${css}
 </head>
 <body>
     <div class="container">
         <div class="header">
-            <h1>{title}</h1>
-            <div class="subtitle">Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</div>
+            <h1>${title}</h1>
+            <div class="subtitle">Generated on ${date}</div>
         </div>
         
         <div class="stats">
             <div class="stat-item">
-                <span class="stat-number">{total_files}</span>
+                <span class="stat-number">${total_files}</span>
                 <span class="stat-label">Files</span>
             </div>
             <div class="stat-item">
-                <span class="stat-number">{total_chars:,}</span>
+                <span class="stat-number">${total_chars}</span>
                 <span class="stat-label">Characters</span>
             </div>
             <div class="stat-item">
-                <span class="stat-number">{total_lines:,}</span>
+                <span class="stat-number">${total_lines}</span>
                 <span class="stat-label">Lines</span>
             </div>
         </div>
         
         <div class="content">
-"""
-    
-    # Add file entries
-    for entry in file_entries:
-        html_doc += f"""
+""")
+
+_ENTRY_HEAD_TMPL = string.Template("""
             <div class="file-entry">
                 <div class="file-header">
-                    <div class="file-title">{html.escape(entry['filename'])}</div>
+                    <div class="file-title">${filename}</div>
                     <div class="file-meta">
-                        <span class="meta-item">📄 {html.escape(entry['size'])}</span>
-                        <span class="meta-item">📝 {html.escape(entry['lines_count'])}</span>
+                        <span class="meta-item">📄 ${size}</span>
+                        <span class="meta-item">📝 ${lines}</span>
                     </div>
                 </div>
                 
                 <div class="preview-section">
                     <div class="preview-title">Preview</div>
                     <div class="preview-lines">
-"""
-        
-        # Add preview lines
-        if entry['preview_lines']:
-            for line in entry['preview_lines']:
-                # Extract line number and content
-                if ':' in line:
-                    parts = line.split(':', 1)
-                    line_num = parts[0].strip()
-                    content = parts[1] if len(parts) > 1 else ''
-                    # HTML escape the content to prevent issues with special characters
-                    content = html.escape(content)
-                    html_doc += f'                        <div class="preview-line"><span class="line-number">{line_num}:</span>{content}</div>\n'
-        else:
-            html_doc += '                        <div class="preview-line">No preview available</div>\n'
-        
-        html_doc += "                    </div>\n"
-        
-        # Add remaining lines info if present
-        if entry['remaining_lines'] > 0:
-            html_doc += f'                    <div class="remaining-lines">+ {entry["remaining_lines"]} more lines...</div>\n'
-        
-        html_doc += """                </div>
-            </div>
-"""
-    
-    # Close HTML
-    html_doc += f"""        </div>
+""")
+
+_DOC_FOOT = """        </div>
         
         <div class="footer">
             Report generated from markdown files analysis
@@ -435,8 +286,239 @@ def generate_html(file_entries, title="Markdown Files Report"):
     </div>
 </body>
 </html>"""
+
+def read_text_file(file_path):
+    """
+    Read a text file and return its contents.
     
-    return html_doc
+    Args:
+        file_path (str): Path to the text file
+        
+    Returns:
+        str: Contents of the text file
+    """
+    try:
+        return read_mapped_text(file_path)
+    except Exception as e:
+        raise Exception(f"Error reading text file: {e}")
+
+def _parse_file_line(file_info, value):
+    """
+    Store the filename from a "File: " header line.
+    
+    Args:
+        file_info (dict): File information being built
+        value (str): Text after the "File: " key
+    """
+    file_info['filename'] = value.strip()
+
+def _parse_size_line(file_info, value):
+    """
+    Store the character and line counts from a "Size: " header line.
+    
+    Malformed values are ignored and leave the defaults in place.
+    
+    Args:
+        file_info (dict): File information being built
+        value (str): Text after the "Size: " key
+    """
+    parts = value.strip().split(',', 1)
+    try:
+        size_chars = int(parts[0].split()[0])
+        lines_count = int(parts[1].split()[0])
+    except (ValueError, IndexError):
+        return
+    file_info['size_chars'] = size_chars
+    file_info['lines_count'] = lines_count
+    file_info['size_display'] = parts[0].strip()
+    file_info['lines_display'] = parts[1].strip()
+
+# Entry header keys and the functions that parse their values
+_HEADER_HANDLERS = {
+    'File': _parse_file_line,
+    'Size': _parse_size_line,
+}
+
+def parse_file_entry(entry_text):
+    """
+    Parse a single file entry from the text format.
+    
+    Args:
+        entry_text (str): Text block for one file
+        
+    Returns:
+        dict: Parsed file information
+    """
+    lines = entry_text.strip().split('\n')
+    
+    # Initialize file info
+    file_info = {
+        'filename': '',
+        'size_chars': 0,
+        'lines_count': 0,
+        'size_display': '',
+        'lines_display': '',
+        'preview_lines': [],
+        'remaining_lines': 0
+    }
+    
+    # Parse file header
+    in_preview_section = False
+    
+    for line in lines:
+        # Skip separator lines
+        if line.lstrip().startswith('--'):
+            continue
+            
+        # Header lines ("File: ...", "Size: ...") are dispatched on their key
+        key, _, value = line.partition(': ')
+        handler = _HEADER_HANDLERS.get(key)
+        if handler:
+            handler(file_info, value)
+        elif line.lstrip().startswith('Preview (first'):
+            # Start collecting preview lines
+            in_preview_section = True
+            continue
+        elif in_preview_section and ':' in line and _PREVIEW_RE.match(line):
+            # This is a preview line
+            file_info['preview_lines'].append(line.strip())
+        elif 'more lines)' in line and '... (' in line:
+            # Extract remaining lines count
+            match = _MORE_RE.search(line)
+            if match:
+                file_info['remaining_lines'] = int(match.group(1))
+            in_preview_section = False  # End of preview section
+    
+    return file_info
+
+def parse_text_content(content):
+    """
+    Parse the entire text content and extract all file entries.
+    
+    Args:
+        content (str): Full text content
+        
+    Returns:
+        list: List of parsed file information dictionaries
+    """
+    # Find the RESULTS section
+    results_start = content.find('RESULTS')
+    if results_start == -1:
+        print("Could not find RESULTS section")
+        return []
+    
+    # Each entry runs from a "File: " line up to the next one (or the end)
+    file_entries = []
+    for match in _ENTRY_RE.finditer(content, results_start):
+        file_info = parse_file_entry(match.group(0))
+        if file_info['filename']:
+            file_entries.append(file_info)
+    
+    return file_entries
+
+@lru_cache(maxsize=1024)
+def _render_entry(filename, size_display, lines_display, preview_lines, remaining_lines):
+    """
+    Render the HTML for one file entry.
+    
+    The result is memoized on the entry's rendered fields, so regenerating a
+    report only renders the entries that changed.
+    
+    Args:
+        filename (str): File name
+        size_display (str): Size text, e.g. "120 characters"
+        lines_display (str): Line count text, e.g. "8 lines"
+        preview_lines (tuple): Preview lines in "N: text" form
+        remaining_lines (int): Number of lines not shown in the preview
+        
+    Returns:
+        str: HTML for the entry
+    """
+    trans = _HTML_TRANS
+    parts = [_ENTRY_HEAD_TMPL.substitute(
+        filename=filename.translate(trans),
+        size=size_display.translate(trans),
+        lines=lines_display.translate(trans),
+    )]
+    
+    # Add preview lines
+    if preview_lines:
+        for line in preview_lines:
+            # Extract line number and content
+            if ':' in line:
+                line_num, content = line.strip().split(':', 1)
+                line_num = line_num.strip()
+                # HTML escape the content to prevent issues with special characters
+                content = content.translate(trans)
+                parts.append(f'                        <div class="preview-line"><span class="line-number">{line_num}:</span>{content}</div>\n')
+    else:
+        parts.append('                        <div class="preview-line">No preview available</div>\n')
+    
+    parts.append("                    </div>\n")
+    
+    # Add remaining lines info if present
+    if remaining_lines > 0:
+        parts.append(f'                    <div class="remaining-lines">+ {remaining_lines} more lines...</div>\n')
+    
+    parts.append("""                </div>
+            </div>
+""")
+    return "".join(parts)
+
+def iter_html(file_entries, title="Markdown Files Report"):
+    """
+    Generate professional HTML from parsed file entries, chunk by chunk.
+    
+    Args:
+        file_entries (list): List of file information dictionaries
+        title (str): HTML page title
+        
+    Yields:
+        str: Successive fragments of the HTML document
+    """
+    
+    # Calculate statistics
+    total_files = len(file_entries)
+    total_chars = sum(entry['size_chars'] for entry in file_entries)
+    total_lines = sum(entry['lines_count'] for entry in file_entries)
+    
+    date_str = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+    
+    # Generate HTML
+    yield _DOC_HEAD_TMPL.substitute(
+        title=title,
+        css=_CSS,
+        date=date_str,
+        total_files=total_files,
+        total_chars=f"{total_chars:,}",
+        total_lines=f"{total_lines:,}",
+    )
+    
+    # Add file entries; unchanged entries come straight from the cache
+    for entry in file_entries:
+        yield _render_entry(
+            entry['filename'],
+            entry['size_display'],
+            entry['lines_display'],
+            tuple(entry['preview_lines']),
+            entry['remaining_lines'],
+        )
+    
+    # Close HTML
+    yield _DOC_FOOT
+
+def generate_html(file_entries, title="Markdown Files Report"):
+    """
+    Generate professional HTML from parsed file entries.
+    
+    Args:
+        file_entries (list): List of file information dictionaries
+        title (str): HTML page title
+        
+    Returns:
+        str: Complete HTML document
+    """
+    return "".join(iter_html(file_entries, title))
 
 def convert_text_file_to_html(input_file, output_file=None):
     """
@@ -463,61 +545,51 @@ def convert_text_file_to_html(input_file, output_file=None):
     for entry in file_entries:
         print(f"  - {entry['filename']}: {len(entry['preview_lines'])} preview lines")
     
-    # Generate HTML
-    print("Generating HTML...")
-    html_content = generate_html(file_entries, "Markdown Files Report")
-    
     # Determine output file name
     if output_file is None:
         input_path = Path(input_file)
         output_file = input_path.with_suffix('.html')
     
-    # Write HTML file
-    print(f"Writing HTML file: {output_file}")
+    # Generate and write HTML file
+    print(f"Generating HTML file: {output_file}")
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.writelines(iter_html(file_entries, "Markdown Files Report"))
     
     print(f"✓ Successfully converted to HTML: {output_file}")
     return output_file
 
-def convert_dict_to_html(file_contents, output_file=None):
+def convert_dict_to_html(file_contents, output_file=None, file_entries=None):
     """
     Main conversion function.
     
     Args:
-        dictionary of str: Strings to process
+        file_contents (dict): File paths mapped to their contents
         output_file (str): Path to output HTML file (optional)
+        file_entries (list): Entries already built from file_contents
+            (optional)
     """
     
-    # Read the text file
-    print(f"Reading file contents...")
-    content = json.dumps(file_contents)
-    print(content)
-    
-    # Parse the content
-    print("Parsing file entries...")
-    file_entries = parse_text_content(content)
+    # Build the entries straight from the file contents
+    if file_entries is None:
+        print("Building file entries...")
+        file_entries = build_entries(file_contents)
     
     if not file_entries:
-        print("No file entries found in the text file.")
+        print("No file entries found in the file contents.")
         return
     
     print(f"Found {len(file_entries)} file entries")
     for entry in file_entries:
         print(f"  - {entry['filename']}: {len(entry['preview_lines'])} preview lines")
     
-    # Generate HTML
-    print("Generating HTML...")
-    html_content = generate_html(file_entries, "Markdown Files Report")
-    
     # Determine output file name
     if output_file is None:
         output_file = 'index.html'
     
-    # Write HTML file
-    print(f"Writing HTML file: {output_file}")
+    # Generate and write HTML file
+    print(f"Generating HTML file: {output_file}")
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.writelines(iter_html(file_entries, "Markdown Files Report"))
     
     print(f"✓ Successfully converted to HTML: {output_file}")
     return output_file
@@ -4,11 +4,14 @@ Script to import and read markdown files.
 
 import sys
 import os
+import mmap
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def get_path():
     # Check if a directory path was provided as command line argument
-    if len(sys.argv) > 2:
+    if len(sys.argv) > 1:
         directory = sys.argv[1]
         if not os.path.exists(directory):
             print(f"Error: Directory '{directory}' does not exist.")
@@ -21,55 +24,142 @@ def get_path():
         print("No directory specified, using current directory.")
     return directory
 
-def print_content(file_contents, md_files):
-    # Display results
-    print(f"\n{'='*60}")
-    print("RESULTS")
-    print(f"{'='*60}")
+def build_entries(file_contents):
+    """
+    Build file entries from a dictionary of file contents.
     
-    successful_reads = 0
-    total_characters = 0
-    total_lines = 0
+    Both the text report and the HTML report are rendered from these
+    entries. Preview lines keep their original whitespace. Files that
+    could not be read (content of None) are skipped.
     
+    Args:
+        file_contents (dict): File paths mapped to their contents
+        
+    Returns:
+        list: List of file information dictionaries
+    """
+    file_entries = []
+    for file_path, content in file_contents.items():
+        if content is None:
+            continue
+        
+        char_count = len(content)
+        line_count = content.count('\n') + (bool(content) and not content.endswith('\n'))
+        
+        # Slice out the first few lines rather than splitting the whole file
+        preview_count = min(5, line_count)
+        preview_lines = []
+        start = 0
+        for i in range(preview_count):
+            end = content.find('\n', start)
+            if end == -1:
+                end = len(content)
+            preview_lines.append(f"{i+1}: {content[start:end]}")
+            start = end + 1
+        
+        file_entries.append({
+            'filename': str(file_path),
+            'size_chars': char_count,
+            'lines_count': line_count,
+            'size_display': f"{char_count} characters",
+            'lines_display': f"{line_count} lines",
+            'preview_lines': preview_lines,
+            'remaining_lines': line_count - preview_count
+        })
+    
+    return file_entries
+
+def render_text_report(file_entries, file_contents, md_files):
+    """
+    Render the plain-text results report from file entries.
+    
+    Args:
+        file_entries (list): Entries built by build_entries()
+        file_contents (dict): File paths mapped to their contents, used to
+            list the files that could not be read
+        md_files (list): All markdown files that were found
+        
+    Returns:
+        str: The report text
+    """
+    buf = []
+    
+    # Display results
+    buf.append(f"\n{'='*60}")
+    buf.append("RESULTS")
+    buf.append(f"{'='*60}")
+    
+    # Look entries up by filename so the report never pairs a file with
+    # another file's details
+    entries = {entry['filename']: entry for entry in file_entries}
     for file_path, content in file_contents.items():
         if content is not None:
-            successful_reads += 1
-            char_count = len(content)
-            line_count = len(content.splitlines())
-            total_characters += char_count
-            total_lines += line_count
-            
-            print(f"\n{'-'*50}")
-            print(f"File: {file_path}")
-            print(f"Size: {char_count} characters, {line_count} lines")
-            print(f"{'-'*50}")
+            entry = entries.get(str(file_path))
+            if entry is None:
+                continue
+            buf.append(f"\n{'-'*50}")
+            buf.append(f"File: {entry['filename']}")
+            buf.append(f"Size: {entry['size_display']}, {entry['lines_display']}")
+            buf.append(f"{'-'*50}")
             
             # Display first few lines as preview
-            lines = content.splitlines()
-            preview_lines = min(5, len(lines))
+            buf.append("Preview (first 5 lines):")
+            for line in entry['preview_lines']:
+                buf.append(f"  {line}")
             
-            print("Preview (first 5 lines):")
-            for i in range(preview_lines):
-                print(f"  {i+1}: {lines[i]}")
-            
-            if len(lines) > preview_lines:
-                print(f"  ... ({len(lines) - preview_lines} more lines)")
-            
-            # Optionally display full content (uncomment if needed)
-            # print("\nFull Content:")
-            # print(content)
+            if entry['remaining_lines'] > 0:
+                buf.append(f"  ... ({entry['remaining_lines']} more lines)")
         else:
-            print(f"\n✗ Failed to read: {file_path}")
+            buf.append(f"\n✗ Failed to read: {file_path}")
+    
+    successful_reads = len(file_entries)
+    total_characters = sum(entry['size_chars'] for entry in file_entries)
+    total_lines = sum(entry['lines_count'] for entry in file_entries)
     
     # Summary
-    print(f"\n{'='*60}")
-    print("SUMMARY")
-    print(f"{'='*60}")
-    print(f"Total files found: {len(md_files)}")
-    print(f"Successfully read: {successful_reads}")
-    print(f"Failed to read: {len(md_files) - successful_reads}")
-    print(f"Total characters: {total_characters:,}")
-    print(f"Total lines: {total_lines:,}")
+    buf.append(f"\n{'='*60}")
+    buf.append("SUMMARY")
+    buf.append(f"{'='*60}")
+    buf.append(f"Total files found: {len(md_files)}")
+    buf.append(f"Successfully read: {successful_reads}")
+    buf.append(f"Failed to read: {len(md_files) - successful_reads}")
+    buf.append(f"Total characters: {total_characters:,}")
+    buf.append(f"Total lines: {total_lines:,}")
+    
+    return "\n".join(buf) + "\n"
+
+def print_content(file_contents, md_files, file_entries=None):
+    # Write the whole report in one go
+    if file_entries is None:
+        file_entries = build_entries(file_contents)
+    sys.stdout.write(render_text_report(file_entries, file_contents, md_files))
+
+def read_mapped_text(file_path):
+    """
+    Read a UTF-8 text file through a read-only memory map.
+    
+    The text is decoded straight from the mapping, so no intermediate
+    bytes copy of the file is made. Inputs that cannot be mapped (empty
+    files, pipes, procfs files) are read normally. Line endings are
+    normalised to LF as they would be by open() in text mode.
+    
+    Args:
+        file_path (str or Path): Path to the file
+        
+    Returns:
+        str: Contents of the file
+    """
+    with open(file_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, 'utf-8')
+        else:
+            # Empty files, pipes and special files cannot be mapped
+            content = f.read().decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
 
 def read_markdown_file(file_path):
     """
@@ -86,9 +176,7 @@ def read_markdown_file(file_path):
         PermissionError: If unable to read the file
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return content
+        return read_mapped_text(file_path)
     except FileNotFoundError:
         raise FileNotFoundError(f"Markdown file not found: {file_path}")
     except PermissionError:
@@ -96,6 +184,21 @@ def read_markdown_file(file_path):
     except Exception as e:
         raise Exception(f"Error reading markdown file: {e}")
 
+def _safe_read(file_path):
+    """
+    Read a markdown file without raising.
+    
+    Args:
+        file_path (str or Path): Path to the markdown file
+        
+    Returns:
+        tuple: (file_path, content or None, exception or None)
+    """
+    try:
+        return file_path, read_markdown_file(file_path), None
+    except Exception as e:
+        return file_path, None, e
+
 def find_markdown_files(directory='.'):
     """
     Find all markdown files in a directory.
@@ -107,7 +210,11 @@ def find_markdown_files(directory='.'):
         list: List of Path objects for markdown files
     """
     directory = Path(directory)
-    md_files = list(directory.glob('*.md'))
+    # scandir reuses the file type reported by the directory listing, so
+    # regular entries need no extra stat call
+    with os.scandir(directory) as entries:
+        md_files = [directory / entry.name for entry in entries
+                    if entry.name.endswith('.md') and entry.is_file()]
     return md_files
 
 def read_all_markdown_files(directory='.'):
@@ -123,13 +230,20 @@ def read_all_markdown_files(directory='.'):
     md_files = find_markdown_files(directory)
     file_contents = {}
     
-    for file_path in md_files:
-        try:
-            content = read_markdown_file(file_path)
-            file_contents[str(file_path)] = content
-            print(f"✓ Successfully read: {file_path}")
-        except Exception as e:
-            print(f"✗ Error reading {file_path}: {e}")
-            file_contents[str(file_path)] = None
+    if not md_files:
+        return file_contents
+    
+    # Read the files concurrently so their I/O overlaps; map keeps the order
+    with ThreadPoolExecutor(max_workers=min(32, len(md_files))) as executor:
+        results = list(executor.map(_safe_read, md_files))
+    
+    messages = []
+    for file_path, content, error in results:
+        file_contents[str(file_path)] = content
+        if error is None:
+            messages.append(f"✓ Successfully read: {file_path}")
+        else:
+            messages.append(f"✗ Error reading {file_path}: {error}")
+    sys.stdout.write("\n".join(messages) + "\n")
     
     return file_contents
\ No newline at end of file